@@ -1,16 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
+import hashlib
 import json
-import re
+import multiprocessing
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from contextlib import asynccontextmanager, closing
 from dataclasses import dataclass
+from functools import partial, wraps
 from pathlib import Path
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 from urllib.parse import urljoin
 
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+except ImportError:  # only needed for --http-details
+    httpx = None
+    HTMLParser = None
 
 BASE_URL = "https://directory.conexpoconagg.com"
 START_URL = "https://directory.conexpoconagg.com/8_0/explore/exhibitor-categories-parent.cfm#/"
@@ -20,8 +43,28 @@ EXHIBITOR_LINK_SELECTOR = "li.js-Card"
 EXHIBITOR_LINK_IN_CARD = "a[href*='/exhibitor/exhibitor-details.cfm?exhid=']"
 VIEW_ALL_LABEL = "View All Exhibitors"
 OUTPUT_CSV = "exhibitors_resume_2.csv"
+CSV_FLUSH_EVERY = 50
+WRITER_QUEUE_SIZE = 256
 CHECKPOINT_FILE = "checkpoint.json"
-RESUME_AFTER_COMPANY_NAME = "Stedman Machine Company"
+CHECKPOINT_EVERY = 10
+SCRAPED_FILE = "scraped_exhibitors.csv"
+WORKER_OUTPUT_CSV = "exhibitors_worker_{index}.csv"
+WORKER_SCRAPED_FILE = "scraped_exhibitors_worker_{index}.csv"
+CACHE_DIR = "cache"
+LISTING_CACHE_TTL = 86400
+MAX_PARALLEL_PAGES = 6
+MAX_PARALLEL_REQUESTS = 16
+HTTP_MAX_CONNECTIONS = 32
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-background-networking",
+    "--disable-features=Translate,BackForwardCache",
+]
+PHONE_SEPARATORS = frozenset("-(). ")
 CSV_HEADERS = [
     "category",
     "subcategory",
@@ -41,86 +84,143 @@ class Category:
 
 
 def _dedupe(values: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in values:
-        if value and value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return ordered
+    return list(dict.fromkeys(filter(None, values)))
 
 
-def _safe_goto(page, url: str, *, retries: int = 2) -> None:
+async def _safe_goto(page, url: str, *, retries: int = 3) -> None:
     attempt = 0
     while True:
         try:
-            page.goto(url, wait_until="networkidle", timeout=60000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             return
-        except PlaywrightTimeoutError:
+        except PlaywrightError as error:
+            if not isinstance(error, PlaywrightTimeoutError) and "net::ERR_" not in error.message:
+                raise
             attempt += 1
             if attempt > retries:
                 raise
-
-
-def _extract_link_text_pairs(page, selector: str) -> list[Category]:
-    elements = page.locator(selector)
-    count = elements.count()
-    categories: list[Category] = []
-    for index in range(count):
-        element = elements.nth(index)
-        href = element.get_attribute("href")
-        name = (element.text_content() or "").strip()
-        if href:
-            categories.append(Category(name=name, url=urljoin(BASE_URL, href)))
-    return categories
-
-
-def _extract_links(page, selector: str) -> list[str]:
-    elements = page.locator(selector)
-    count = elements.count()
-    return _dedupe(
-        [urljoin(BASE_URL, elements.nth(i).get_attribute("href") or "") for i in range(count)]
+            await asyncio.sleep(min(30, 2**attempt) + random.random())
+
+
+async def _extract_link_text_pairs(page, selector: str) -> list[Category]:
+    rows = await page.evaluate(
+        """
+        (selector) => Array.from(document.querySelectorAll(selector)).map((a) => ({
+            name: (a.textContent || "").trim(),
+            href: a.getAttribute("href"),
+        }))
+        """,
+        selector,
     )
-
-
-def _count_exhibitor_cards(page) -> int:
-    page.wait_for_selector(EXHIBITOR_LINK_SELECTOR, timeout=60000)
-    return page.locator(EXHIBITOR_LINK_SELECTOR).count()
-
-
-def _extract_exhibitor_details(page) -> dict[str, str] | None:
-    page.wait_for_selector(".exhibitor-name", timeout=60000)
-    company_name = (page.locator(".exhibitor-name").first.text_content() or "").strip()
-
-    contact = page.locator("article#js-vue-contactinfo")
-    address_lines = [
-        (line.text_content() or "").strip() for line in contact.locator("address p").all()
+    return [
+        Category(name=row["name"], url=urljoin(BASE_URL, row["href"]))
+        for row in rows
+        if row["href"]
     ]
-    address = ", ".join([line for line in address_lines if line])
-
-    website_link = contact.locator("a[href^='http']")
-    if website_link.count() > 0:
-        website = (website_link.first.get_attribute("href") or "").strip()
-    else:
-        website = ""
 
-    contact_text = contact.inner_text()
-    phone_match = re.search(r"(\+?\d[\d\-(). ]{6,}\d)", contact_text)
-    phone = phone_match.group(1).strip() if phone_match else ""
 
-    description_locator = page.locator("#section-description")
-    if description_locator.count() > 0:
-        description = (description_locator.first.text_content() or "").strip()
-    else:
-        description = ""
+async def _extract_links(page, selector: str) -> list[str]:
+    # a.href is resolved by the browser against the listing page itself, so
+    # relative card links keep their /8_0/ prefix.
+    hrefs = await page.evaluate(
+        """
+        (selector) => Array.from(document.querySelectorAll(selector)).map((a) => a.href)
+        """,
+        selector,
+    )
+    return _dedupe(hrefs)
+
+
+def _disk_cache(*, ttl: int):
+    # Caches a page-loading coroutine's JSON result under CACHE_DIR, keyed by
+    # the arguments after the page, so a fresh hit skips the navigation. A
+    # None result (the listing never rendered) is not cached.
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(page, *args):
+            key = json.dumps([func.__name__, *args]).encode("utf-8")
+            cache_path = Path(CACHE_DIR) / f"{hashlib.sha1(key).hexdigest()}.json"
+            try:
+                if time.time() - cache_path.stat().st_mtime < ttl:
+                    return json.loads(cache_path.read_bytes())
+            except FileNotFoundError:
+                pass
+
+            result = await func(page, *args)
+            if result is None:
+                return None
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(result), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# The loaders return None when the page loaded but the selector never showed
+# up (an empty listing); a failed navigation still raises from _safe_goto.
+@_disk_cache(ttl=LISTING_CACHE_TTL)
+async def _load_link_pairs(page, url: str, selector: str) -> list[list[str]] | None:
+    await _safe_goto(page, url)
+    try:
+        await page.wait_for_selector(selector, timeout=60000)
+    except PlaywrightTimeoutError:
+        return None
+    return [[link.name, link.url] for link in await _extract_link_text_pairs(page, selector)]
 
-    booth_links = page.locator("#myssidebar a#newfloorplanlink")
-    booth_values = [
-        (booth_links.nth(i).text_content() or "").strip() for i in range(booth_links.count())
-    ]
-    booth = "; ".join([value for value in booth_values if value])
 
-    if not all([company_name, address, website, phone, description, booth]):
+@_disk_cache(ttl=LISTING_CACHE_TTL)
+async def _load_links(page, url: str, selector: str) -> list[str] | None:
+    await _safe_goto(page, url)
+    try:
+        await page.wait_for_selector(selector, timeout=60000)
+    except PlaywrightTimeoutError:
+        return None
+    return await _extract_links(page, selector)
+
+
+async def _collect_exhibitor_urls(page, url: str) -> list[str] | None:
+    return await _load_links(page, url, f"{EXHIBITOR_LINK_SELECTOR} {EXHIBITOR_LINK_IN_CARD}")
+
+
+def _extract_phone(contact_text: str) -> str:
+    # Linear scan equivalent to re.search(r"\+?\d[\d\-(). ]{6,}\d"): take the
+    # first run of digits/separators that starts with a digit and has a digit
+    # at least 7 characters further on, trimmed back to its last digit.
+    length = len(contact_text)
+    start = 0
+    while start < length:
+        if not contact_text[start].isdecimal():
+            start += 1
+            continue
+        end = start + 1
+        last_digit = start
+        while end < length and (
+            contact_text[end].isdecimal() or contact_text[end] in PHONE_SEPARATORS
+        ):
+            if contact_text[end].isdecimal():
+                last_digit = end
+            end += 1
+        if last_digit - start >= 7:
+            if start > 0 and contact_text[start - 1] == "+":
+                start -= 1
+            return contact_text[start : last_digit + 1]
+        start = end
+    return ""
+
+
+def _details_record(
+    company_name: str,
+    address: str,
+    website: str,
+    phone: str,
+    description: str,
+    booth: str,
+) -> dict[str, str] | None:
+    if not (company_name and address and website and phone and description and booth):
         return None
 
     return {
@@ -133,12 +233,130 @@ def _extract_exhibitor_details(page) -> dict[str, str] | None:
     }
 
 
-def _load_checkpoint() -> dict[str, str] | None:
-    checkpoint_path = Path(CHECKPOINT_FILE)
-    if not checkpoint_path.exists():
+async def _extract_exhibitor_details(page) -> dict[str, str] | None:
+    await page.wait_for_selector(".exhibitor-name", timeout=60000)
+    # The contact block is filled in by Vue after DOMContentLoaded; if no
+    # address shows up the record would be dropped anyway, so treat it as
+    # missing fields rather than a failed load.
+    try:
+        await page.wait_for_selector(
+            "article#js-vue-contactinfo address p", state="attached", timeout=15000
+        )
+    except PlaywrightTimeoutError:
         return None
-    with checkpoint_path.open("r", encoding="utf-8") as file_handle:
-        return json.load(file_handle)
+    fields = await page.evaluate(
+        """
+        () => {
+            const text = (element) => (element ? element.textContent || "" : "").trim();
+            const contact = document.querySelector("article#js-vue-contactinfo");
+            const website = contact ? contact.querySelector("a[href^='http']") : null;
+            return {
+                company_name: text(document.querySelector(".exhibitor-name")),
+                address_lines: contact
+                    ? Array.from(contact.querySelectorAll("address p"), text)
+                    : [],
+                website: website ? (website.getAttribute("href") || "").trim() : "",
+                contact_text: contact ? contact.innerText : "",
+                description: text(document.querySelector("#section-description")),
+                booth_values: Array.from(
+                    document.querySelectorAll("#myssidebar a#newfloorplanlink"),
+                    text
+                ),
+            };
+        }
+        """
+    )
+    address = ", ".join([line for line in fields["address_lines"] if line])
+    phone = _extract_phone(fields["contact_text"])
+    booth = "; ".join([value for value in fields["booth_values"] if value])
+
+    return _details_record(
+        fields["company_name"],
+        address,
+        fields["website"],
+        phone,
+        fields["description"],
+        booth,
+    )
+
+
+def _parse_exhibitor_html(html: str) -> dict[str, str] | None:
+    tree = HTMLParser(html)
+    name_node = tree.css_first(".exhibitor-name")
+    company_name = (name_node.text() if name_node else "").strip()
+
+    contact = tree.css_first("article#js-vue-contactinfo")
+    if contact is None:
+        return None
+    address_lines = [line.text().strip() for line in contact.css("address p")]
+    address = ", ".join([line for line in address_lines if line])
+
+    website_link = contact.css_first("a[href^='http']")
+    website = (website_link.attributes.get("href") or "").strip() if website_link else ""
+
+    phone = _extract_phone(contact.text(separator="\n"))
+
+    description_node = tree.css_first("#section-description")
+    description = (description_node.text() if description_node else "").strip()
+
+    booth_values = [link.text().strip() for link in tree.css("#myssidebar a#newfloorplanlink")]
+    booth = "; ".join([value for value in booth_values if value])
+
+    return _details_record(company_name, address, website, phone, description, booth)
+
+
+async def _scrape_exhibitor(pages: asyncio.Queue, url: str) -> dict[str, str] | None:
+    page = await pages.get()
+    try:
+        try:
+            await _safe_goto(page, url)
+            details = await _extract_exhibitor_details(page)
+        except PlaywrightTimeoutError:
+            print(f"Skipping exhibitor {url} due to timeout")
+            return None
+        except PlaywrightError as error:
+            print(f"Skipping exhibitor {url} due to {error.message}")
+            # The page may have crashed or been closed; swap in a fresh one so
+            # the failure doesn't follow it to every later exhibitor. If the
+            # context itself is gone, new_page() raises and stops the run.
+            context = page.context
+            try:
+                await page.close()
+            except PlaywrightError:
+                pass
+            page = await context.new_page()
+            return None
+        if details is None:
+            print(f"Skipping exhibitor {url} due to missing fields")
+            return {}
+        return details
+    finally:
+        pages.put_nowait(page)
+
+
+async def _fetch_exhibitor(client, semaphore: asyncio.Semaphore, url: str) -> dict[str, str] | None:
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            print(f"Skipping exhibitor {url} due to {error!r}")
+            return None
+    details = _parse_exhibitor_html(response.text)
+    if details is None:
+        # Not reported as an empty record: the fields may simply not be in the
+        # server HTML, and a browser run should still get to try this page.
+        print(f"Skipping exhibitor {url} due to missing fields")
+        return None
+    return details
+
+
+def _load_scraped() -> set[tuple[str, str, str]]:
+    scraped_path = Path(SCRAPED_FILE)
+    if not scraped_path.exists():
+        return set()
+    with scraped_path.open("r", encoding="utf-8", newline="") as file_handle:
+        return {tuple(row) for row in csv.reader(file_handle) if len(row) == 3}
 
 
 def _save_checkpoint(category: str, subcategory: str, exhibitor_index: int) -> None:
@@ -148,214 +366,419 @@ def _save_checkpoint(category: str, subcategory: str, exhibitor_index: int) -> N
         "subcategory": subcategory,
         "exhibitor_index": exhibitor_index,
     }
-    with checkpoint_path.open("w", encoding="utf-8") as file_handle:
-        json.dump(payload, file_handle)
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(payload))
+    else:
+        with tmp_path.open("w", encoding="utf-8") as file_handle:
+            json.dump(payload, file_handle)
+    os.replace(tmp_path, checkpoint_path)
+
+
+class CsvSink:
+    # Rows, scraped URLs and checkpoints are handed to a single writer thread
+    # through a bounded queue, so the scrape loop never waits on disk.
+
+    def __init__(
+        self, path: str, scraped_path: str, *, flush_every: int = CSV_FLUSH_EVERY
+    ) -> None:
+        csv_path = Path(path)
+        write_header = not csv_path.exists()
+        self._fh = csv_path.open("a", encoding="utf-8", newline="", buffering=1 << 20)
+        self._writer = csv.DictWriter(self._fh, fieldnames=CSV_HEADERS)
+        if write_header:
+            self._writer.writeheader()
+        self._scraped_fh = Path(scraped_path).open("a", encoding="utf-8", newline="")
+        self._scraped_writer = csv.writer(self._scraped_fh)
+        self._flush_every = flush_every
+        self._queue: queue.Queue[tuple[str, object] | None] = queue.Queue(WRITER_QUEUE_SIZE)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def write(self, row: dict[str, str]) -> None:
+        self._put(("row", row))
+
+    def mark_scraped(self, category: str, subcategory: str, url: str) -> None:
+        self._put(("scraped", [category, subcategory, url]))
+
+    def flush(self) -> None:
+        self._put(("flush", None))
+
+    def checkpoint(self, category: str, subcategory: str, exhibitor_index: int) -> None:
+        # Saved by the writer thread once everything queued before it is on disk.
+        self._put(("checkpoint", (category, subcategory, exhibitor_index)))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._fh.close()
+            self._scraped_fh.close()
+        finally:
+            self._raise_if_failed()
+
+    def _put(self, item: tuple[str, object]) -> None:
+        self._raise_if_failed()
+        self._queue.put(item)
+
+    def _raise_if_failed(self) -> None:
+        # Errors from the writer thread surface in the scraping thread.
+        if self._error is not None:
+            raise self._error
+
+    def _writer_loop(self) -> None:
+        rows: list[dict[str, str]] = []
+        scraped: list[list[str]] = []
+        while True:
+            item = self._queue.get()
+            if self._error is not None:
+                # Keep draining after a failure so producers never block on a
+                # full queue; the stored error is raised on their next call.
+                if item is None:
+                    return
+                continue
+            try:
+                if self._process(item, rows, scraped):
+                    return
+            except Exception as error:
+                self._error = error
+
+    def _process(
+        self,
+        item: tuple[str, object] | None,
+        rows: list[dict[str, str]],
+        scraped: list[list[str]],
+    ) -> bool:
+        if item is None:
+            self._write_batch(rows, scraped)
+            return True
+        kind, value = item
+        if kind == "row":
+            rows.append(value)
+        elif kind == "scraped":
+            scraped.append(value)
+        if kind in ("flush", "checkpoint") or len(rows) >= self._flush_every:
+            self._write_batch(rows, scraped)
+        if kind == "checkpoint":
+            _save_checkpoint(*value)
+        return False
+
+    def _write_batch(self, rows: list[dict[str, str]], scraped: list[list[str]]) -> None:
+        # Rows go to disk before the URLs that vouch for them.
+        self._writer.writerows(rows)
+        self._fh.flush()
+        self._scraped_writer.writerows(scraped)
+        self._scraped_fh.flush()
+        rows.clear()
+        scraped.clear()
+
+
+async def _block_unneeded_requests(route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_context(browser):
+    context = await browser.new_context(
+        java_script_enabled=True,
+        bypass_csp=True,
+        ignore_https_errors=True,
+        service_workers="block",
+        viewport={"width": 1024, "height": 768},
+    )
+    await context.route("**/*", _block_unneeded_requests)
+    return context
+
+
+async def _collect_subcategories(page, category: Category) -> list[Category] | None:
+    links = await _load_link_pairs(page, category.url, SUBCATEGORY_LINK_SELECTOR)
+    if links is None:
+        return None
+    subcategories = [Category(name=name, url=url) for name, url in links]
+    return [subcategory for subcategory in subcategories if subcategory.name != VIEW_ALL_LABEL]
+
+
+async def _collect_subcategory_pairs(
+    page,
+    categories: list[Category],
+) -> list[tuple[str, Category]]:
+    pairs: list[tuple[str, Category]] = []
+    for category in categories:
+        subcategories = await _collect_subcategories(page, category)
+        if subcategories is None:
+            print(f"Category {category.name} has 0 subcategories (no table rows)")
+            continue
+        print(f"Category {category.name} has {len(subcategories)} subcategories")
+
+        for subcategory in subcategories:
+            pairs.append((category.name, subcategory))
+    return pairs
+
+
+@asynccontextmanager
+async def _exhibitor_scraper(browser, http_details: bool):
+    # Detail pages are fetched concurrently, either as raw HTML over HTTP
+    # or from a pool of pages, each in its own context; listing pages stay
+    # on the caller's page.
+    if http_details:
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+            follow_redirects=True,
+        ) as client:
+            yield partial(_fetch_exhibitor, client, asyncio.Semaphore(MAX_PARALLEL_REQUESTS))
+        return
 
+    worker_contexts = [await _new_context(browser) for _ in range(MAX_PARALLEL_PAGES)]
+    try:
+        pages: asyncio.Queue = asyncio.Queue()
+        for worker_context in worker_contexts:
+            pages.put_nowait(await worker_context.new_page())
+        yield partial(_scrape_exhibitor, pages)
+    finally:
+        for worker_context in worker_contexts:
+            await worker_context.close()
+
+
+def _record_exhibitor(
+    sink: CsvSink,
+    category_name: str,
+    subcategory_name: str,
+    url: str,
+    details: dict[str, str] | None,
+) -> None:
+    if details is None:
+        return
 
-def _init_csv() -> None:
-    csv_path = Path(OUTPUT_CSV)
-    if csv_path.exists():
+    # An empty record means the page loaded but lacked fields; it is marked
+    # as scraped so it is not fetched again.
+    sink.mark_scraped(category_name, subcategory_name, url)
+    if not details:
         return
-    with csv_path.open("w", encoding="utf-8", newline="") as file_handle:
-        writer = csv.DictWriter(file_handle, fieldnames=CSV_HEADERS)
-        writer.writeheader()
+
+    sink.write(
+        {
+            "category": category_name,
+            "subcategory": subcategory_name,
+            **details,
+        }
+    )
+    print(
+        "Exhibitor",
+        details["company_name"],
+        "|",
+        details["booth"],
+        "|",
+        details["phone"],
+    )
+
+
+async def _scrape_subcategory(
+    page,
+    scrape_exhibitor,
+    sink: CsvSink,
+    scraped: set[tuple[str, str, str]],
+    category_name: str,
+    subcategory: Category,
+) -> AsyncIterator[int]:
+    exhibitor_urls = await _collect_exhibitor_urls(page, subcategory.url)
+    if exhibitor_urls is None:
+        print(f"Subcategory {subcategory.name} has 0 exhibitors (no cards)")
+        return
+
+    print(f"Subcategory {subcategory.name} has {len(exhibitor_urls)} exhibitors")
+
+    # Every exhibitor not yet recorded in SCRAPED_FILE gets a task up front;
+    # the page pool (or request semaphore) bounds how many run at once.
+    exhibitor_index = 0
+    tasks = [
+        None
+        if (category_name, subcategory.name, url) in scraped
+        else asyncio.ensure_future(scrape_exhibitor(url))
+        for url in exhibitor_urls
+    ]
+    try:
+        # Results are handed to the sink as soon as they and every card before
+        # them are done, so rows keep card order without waiting for the whole
+        # subcategory, and the running exhibitor index is yielded after each.
+        for url, task in zip(exhibitor_urls, tasks):
+            details = await task if task is not None else None
+            _record_exhibitor(sink, category_name, subcategory.name, url, details)
+            exhibitor_index += 1
+            yield exhibitor_index
+    finally:
+        for task in tasks:
+            if task is not None:
+                task.cancel()
+
+
+def _merge_worker_shards() -> None:
+    output_path = Path(OUTPUT_CSV)
+    for shard_path in sorted(Path().glob(WORKER_OUTPUT_CSV.format(index="*"))):
+        with shard_path.open("rb") as source, output_path.open("ab") as target:
+            header = source.readline()
+            if target.tell() == 0:
+                target.write(header)
+            shutil.copyfileobj(source, target)
+        shard_path.unlink()
+
+    scraped_path = Path(SCRAPED_FILE)
+    for shard_path in sorted(Path().glob(WORKER_SCRAPED_FILE.format(index="*"))):
+        with shard_path.open("rb") as source, scraped_path.open("ab") as target:
+            shutil.copyfileobj(source, target)
+        shard_path.unlink()
+
+
+async def _scrape_shard_pairs(
+    shard_index: int,
+    pairs: list[tuple[str, Category]],
+    scraped: set[tuple[str, str, str]],
+    http_details: bool,
+) -> None:
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = await _new_context(browser)
+        page = await context.new_page()
+
+        async with _exhibitor_scraper(browser, http_details) as scrape_exhibitor:
+            sink = CsvSink(
+                WORKER_OUTPUT_CSV.format(index=shard_index),
+                WORKER_SCRAPED_FILE.format(index=shard_index),
+            )
+            with closing(sink):
+                for category_name, subcategory in pairs:
+                    async for _ in _scrape_subcategory(
+                        page, scrape_exhibitor, sink, scraped, category_name, subcategory
+                    ):
+                        pass
+                    sink.flush()
+
+        await context.close()
+        await browser.close()
+
+
+def _scrape_shard(
+    shard_index: int,
+    pairs: list[tuple[str, Category]],
+    scraped: set[tuple[str, str, str]],
+    http_details: bool,
+) -> None:
+    asyncio.run(_scrape_shard_pairs(shard_index, pairs, scraped, http_details))
 
 
-def _append_row(row: dict[str, str]) -> None:
-    with Path(OUTPUT_CSV).open("a", encoding="utf-8", newline="") as file_handle:
-        writer = csv.DictWriter(file_handle, fieldnames=CSV_HEADERS)
-        writer.writerow(row)
+def _scrape_sharded(
+    pairs: list[tuple[str, Category]],
+    processes: int,
+    scraped: set[tuple[str, str, str]],
+    http_details: bool,
+) -> None:
+    processes = min(processes, len(pairs))
+    shards = [
+        (shard_index, pairs[shard_index::processes], scraped, http_details)
+        for shard_index in range(processes)
+    ]
+    # Each worker runs its own Playwright driver, which is not fork-safe.
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        pool.starmap(_scrape_shard, shards)
+    _merge_worker_shards()
 
 
-def run(
+async def run(
     *,
     list_categories: bool = False,
     list_subcategories: bool = False,
     fresh: bool = False,
+    http_details: bool = False,
+    processes: int = 1,
+    refresh_cache: bool = False,
 ) -> None:
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        _init_csv()
-        checkpoint = {} if fresh else (_load_checkpoint() or {})
-        resume_category = checkpoint.get("category")
-        resume_subcategory = checkpoint.get("subcategory")
-        resume_exhibitor_index = int(checkpoint.get("exhibitor_index", 0) or 0)
-        resume_mode = bool(resume_category and resume_subcategory)
-        resume_after_name = "" if fresh else RESUME_AFTER_COMPANY_NAME.strip().lower()
-        resume_name_found = not resume_after_name
-
-        _safe_goto(page, START_URL)
-        page.wait_for_timeout(1500)
-        page.wait_for_selector(CATEGORY_LINK_SELECTOR, timeout=60000)
-
-        categories = _extract_link_text_pairs(page, CATEGORY_LINK_SELECTOR)
+    if http_details and httpx is None:
+        raise SystemExit("--http-details requires httpx[http2] and selectolax")
+    if processes < 1:
+        raise SystemExit("--processes must be at least 1")
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = await _new_context(browser)
+        page = await context.new_page()
+
+        if refresh_cache:
+            shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+        links = await _load_link_pairs(page, START_URL, CATEGORY_LINK_SELECTOR)
+        if links is None:
+            raise SystemExit(f"No categories rendered on {START_URL}")
+        categories = [Category(name=name, url=url) for name, url in links]
         categories = [category for category in categories if category.name != VIEW_ALL_LABEL]
         print(f"Found {len(categories)} categories")
         if list_categories:
             for category in categories:
                 print(category.name)
-            context.close()
-            browser.close()
+            await context.close()
+            await browser.close()
             return
         if list_subcategories:
             for category in categories:
-                _safe_goto(page, category.url)
-                page.wait_for_timeout(1000)
-                try:
-                    page.wait_for_selector(SUBCATEGORY_LINK_SELECTOR, timeout=60000)
-                except PlaywrightTimeoutError:
+                subcategories = await _collect_subcategories(page, category)
+                if subcategories is None:
                     print(f"{category.name}: 0 subcategories")
                     continue
-                subcategories = _extract_link_text_pairs(page, SUBCATEGORY_LINK_SELECTOR)
-                subcategories = [
-                    subcategory for subcategory in subcategories if subcategory.name != VIEW_ALL_LABEL
-                ]
                 print(f"{category.name}: {len(subcategories)} subcategories")
                 for subcategory in subcategories:
                     print(f"- {subcategory.name}")
-            context.close()
-            browser.close()
+            await context.close()
+            await browser.close()
             return
 
-        category_started = not resume_mode
-        for category in categories:
-            if not category_started:
-                if category.name == resume_category:
-                    category_started = True
-                else:
-                    continue
-
-            _safe_goto(page, category.url)
-            page.wait_for_timeout(1000)
-            try:
-                page.wait_for_selector(SUBCATEGORY_LINK_SELECTOR, timeout=60000)
-            except PlaywrightTimeoutError:
-                print(f"Category {category.name} has 0 subcategories (no table rows)")
-                continue
-
-            subcategories = _extract_link_text_pairs(page, SUBCATEGORY_LINK_SELECTOR)
-            subcategories = [
-                subcategory for subcategory in subcategories if subcategory.name != VIEW_ALL_LABEL
-            ]
-            print(f"Category {category.name} has {len(subcategories)} subcategories")
-
-            subcategory_started = not resume_mode or category.name != resume_category
-            for subcategory in subcategories:
-                if resume_mode and category.name == resume_category and not subcategory_started:
-                    if subcategory.name == resume_subcategory:
-                        subcategory_started = True
-                    continue
-
-                _safe_goto(page, subcategory.url)
-                page.wait_for_timeout(1000)
-                try:
-                    exhibitor_count = _count_exhibitor_cards(page)
-                except PlaywrightTimeoutError:
-                    print(
-                        f"Subcategory {subcategory.name} has 0 exhibitors (no cards)"
-                    )
-                    _save_checkpoint(category.name, subcategory.name, 0)
-                    continue
-
-                print(
-                    f"Subcategory {subcategory.name} has {exhibitor_count} exhibitors"
-                )
-
-                exhibitor_index = 0
-                if resume_mode and category.name == resume_category and subcategory.name == resume_subcategory:
-                    exhibitor_index = resume_exhibitor_index
-                seen_exhibitors: set[str] = set()
-                while exhibitor_index < exhibitor_count:
-                    cards = page.locator(EXHIBITOR_LINK_SELECTOR)
-                    if exhibitor_index >= cards.count():
-                        break
-
-                    page.evaluate(
-                        """
-                        () => {
-                            const overlay = document.querySelector('.introjs-overlay');
-                            if (overlay) {
-                                overlay.remove();
-                            }
-                            const skip = document.querySelector('.introjs-skipbutton');
-                            if (skip) {
-                                skip.click();
-                            }
-                        }
-                        """
-                    )
-
-                    card = cards.nth(exhibitor_index)
-                    link = card.locator(EXHIBITOR_LINK_IN_CARD)
-                    if link.count() == 0:
-                        exhibitor_index += 1
-                        continue
-
-                    exhibitor_href = link.first.get_attribute("href") or ""
-                    if exhibitor_href in seen_exhibitors:
-                        exhibitor_index += 1
-                        continue
-                    seen_exhibitors.add(exhibitor_href)
-
-                    link.first.scroll_into_view_if_needed()
-                    link.first.click()
-                    page.wait_for_timeout(500)
-
-                    timed_out = False
+        # Rows left behind by an interrupted sharded run are folded in first so
+        # that they count as scraped.
+        _merge_worker_shards()
+        # Every subcategory is walked on every run; SCRAPED_FILE alone decides
+        # which exhibitors are skipped, so pages that failed or were missed
+        # before are tried again.
+        scraped = set() if fresh else _load_scraped()
+        pairs = await _collect_subcategory_pairs(page, categories)
+
+        if processes == 1:
+            async with _exhibitor_scraper(browser, http_details) as scrape_exhibitor:
+                with closing(CsvSink(OUTPUT_CSV, SCRAPED_FILE)) as sink:
+                    # checkpoint.json only logs progress for the operator; it is not
+                    # read back. It is written every CHECKPOINT_EVERY exhibitors and
+                    # at subcategory boundaries, and the finally block records the
+                    # exact position if the run stops in between.
+                    position: tuple[str, str, int] | None = None
                     try:
-                        details = _extract_exhibitor_details(page)
-                    except PlaywrightTimeoutError:
-                        print(f"Skipping exhibitor {page.url} due to timeout")
-                        details = None
-                        timed_out = True
-
-                    if details is None:
-                        if not timed_out:
-                            print(
-                                f"Skipping exhibitor {page.url} due to missing fields"
-                            )
-                    else:
-                        company_name = details["company_name"].strip()
-                        if not resume_name_found:
-                            if company_name.lower() == resume_after_name:
-                                resume_name_found = True
-                                print(
-                                    f"Found resume company {company_name}, continuing"
-                                )
-                            page.go_back(wait_until="networkidle")
-                            page.wait_for_timeout(1000)
-                            exhibitor_index += 1
-                            _save_checkpoint(category.name, subcategory.name, exhibitor_index)
-                            continue
-
-                        _append_row(
-                            {
-                                "category": category.name,
-                                "subcategory": subcategory.name,
-                                **details,
-                            }
-                        )
-                        print(
-                            "Exhibitor",
-                            details["company_name"],
-                            "|",
-                            details["booth"],
-                            "|",
-                            details["phone"],
-                        )
-
-                    page.go_back(wait_until="networkidle")
-                    page.wait_for_timeout(1000)
-                    exhibitor_index += 1
-                    _save_checkpoint(category.name, subcategory.name, exhibitor_index)
-
-                _save_checkpoint(category.name, subcategory.name, exhibitor_index)
-
-        context.close()
-        browser.close()
+                        for category_name, subcategory in pairs:
+                            exhibitor_index = 0
+                            async for exhibitor_index in _scrape_subcategory(
+                                page,
+                                scrape_exhibitor,
+                                sink,
+                                scraped,
+                                category_name,
+                                subcategory,
+                            ):
+                                position = (category_name, subcategory.name, exhibitor_index)
+                                if exhibitor_index % CHECKPOINT_EVERY == 0:
+                                    sink.checkpoint(*position)
+
+                            position = (category_name, subcategory.name, exhibitor_index)
+                            sink.checkpoint(*position)
+                    finally:
+                        if position is not None:
+                            sink.checkpoint(*position)
+
+        await context.close()
+        await browser.close()
+
+    if processes > 1 and pairs:
+        _scrape_sharded(pairs, processes, scraped, http_details)
 
 
 if __name__ == "__main__":
@@ -373,11 +796,32 @@ if __name__ == "__main__":
     parser.add_argument(
         "--fresh",
         action="store_true",
-        help="Ignore checkpoints and resume hints",
+        help="Re-scrape exhibitors already recorded as scraped",
+    )
+    parser.add_argument(
+        "--http-details",
+        action="store_true",
+        help="Fetch exhibitor detail pages over HTTP instead of the browser",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Shard subcategories across this many browser processes",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Discard cached category/subcategory listings before scraping",
     )
     args = parser.parse_args()
-    run(
-        list_categories=args.list_categories,
-        list_subcategories=args.list_subcategories,
-        fresh=args.fresh,
+    asyncio.run(
+        run(
+            list_categories=args.list_categories,
+            list_subcategories=args.list_subcategories,
+            fresh=args.fresh,
+            http_details=args.http_details,
+            processes=args.processes,
+            refresh_cache=args.refresh_cache,
+        )
     )